@@ -1,6 +1,6 @@
 import cocotb
 import os
-from cocotb.triggers import Timer, RisingEdge, FallingEdge
+from cocotb.triggers import Timer, RisingEdge, FallingEdge, ValueChange
 from cocotb.clock import Clock
 from test_utils import NOP_INSTR, CLK_HZ, FLASH_BASE_ADDR, PSRAM_BASE_ADDR
 
@@ -30,10 +30,7 @@ def convert_hex_memory_to_byte_memory(hex_memory):
     """Convert hex memory to byte memory"""
     byte_memory = bytearray(32 * 1024 * 1024)
     for addr, value in hex_memory.items():
-        byte_memory[addr] = value & 0xFF
-        byte_memory[addr + 1] = (value >> 8) & 0xFF
-        byte_memory[addr + 2] = (value >> 16) & 0xFF
-        byte_memory[addr + 3] = (value >> 24) & 0xFF
+        byte_memory[addr:addr + 4] = (value & 0xFFFFFFFF).to_bytes(4, "little")
     return byte_memory
 
 def load_bin_file(bin_file_path):
@@ -96,8 +93,12 @@ def write_byte_to_memory(memory, addr, data):
     """Write a 8-bit byte to byte-addressed memory"""
     memory[addr] = data & 0xFF
 
-async def test_spi_memory(dut, memory, max_cycles, callback):
-    """Test the SPI memory"""
+async def test_spi_memory(dut, memory, max_cycles, callback, watch=None):
+    """Test the SPI memory
+
+    The callback runs after every cycle, or, when a watch signal is given
+    (e.g. the core's PC), only after cycles in which that signal changed.
+    """
 
     clk_cycle_time = 1_000_000_000 / CLK_HZ
 
@@ -123,6 +124,16 @@ async def test_spi_memory(dut, memory, max_cycles, callback):
 
     dut.bus_io_in.value = 0;
 
+    watch_changed = True
+    watcher = None
+    if watch is not None:
+        async def track_watch():
+            nonlocal watch_changed
+            while True:
+                await ValueChange(watch)
+                watch_changed = True
+        watcher = cocotb.start_soon(track_watch())
+
     for _ in range(max_cycles):
         if fsm_state == FSM_IDLE:
             await FallingEdge(dut.clk)
@@ -271,8 +282,14 @@ async def test_spi_memory(dut, memory, max_cycles, callback):
                         elif fsm_state == FSM_DONE:
                             fsm_state = FSM_IDLE
 
-        if callback(dut, memory):
-            return
+        if watch_changed:
+            watch_changed = watch is None
+            if callback(dut, memory):
+                if watcher is not None:
+                    watcher.cancel()
+                return
 
+    if watcher is not None:
+        watcher.cancel()
     assert False, "Failed"
 
@@ -0,0 +1,159 @@
+"""Run cocotb test modules as individual pytest cases
+
+Every @cocotb.test() in a suite becomes its own pytest case, so the
+suites can be spread across CPU cores with pytest-xdist:
+
+    pytest -n auto tb/cocotb/run_tests.py
+    SIM=verilator pytest -n auto tb/cocotb/run_tests.py -k "test_rv32i_core::"
+    pytest -n auto tb/cocotb/run_tests.py -k test_rv32i_core_jump
+    pytest -n auto tb/cocotb/run_tests.py -k test_rv32i_register
+
+The HDL is elaborated once per suite (and per xdist worker); each case
+then only launches the simulator with a test filter.
+"""
+
+import ast
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+from cocotb_tools.runner import get_runner, get_results
+
+TB_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = TB_DIR.parents[1]
+RTL_DIR = PROJECT_ROOT / "rtl"
+
+SIM = os.environ.get("SIM", "icarus")
+TB_CLOCK = os.environ.get("TB_CLOCK")
+
+CORE_SOURCES = [
+    RTL_DIR / "rv32i_core.sv",
+    RTL_DIR / "rv32i_alu.v",
+    RTL_DIR / "rv32i_register.v",
+    RTL_DIR / "rv32i_csr.v",
+    RTL_DIR / "rv32c_decompress.v",
+    TB_DIR / "test_rv32i_core_tb.sv",
+]
+
+# Test module -> (toplevel, HDL sources)
+SUITES = {
+    "test_rv32i_core": ("test_rv32i_core_tb", CORE_SOURCES),
+    "test_rv32i_core_jump": ("test_rv32i_core_tb", CORE_SOURCES),
+    "test_rv32i_register": (
+        "test_rv32i_register_tb",
+        [RTL_DIR / "rv32i_register.v", TB_DIR / "test_rv32i_register_tb.v"],
+    ),
+}
+
+# Testbenches that always generate their own clock, TB_CLOCK or not
+CLOCKED_TESTBENCHES = {"test_rv32i_register_tb"}
+
+# Suites that use the testbench clock unless TB_CLOCK=0 is given, matching
+# the TB_CLOCK ?= 1 default in their makefiles
+TB_CLOCK_SUITES = {"test_rv32i_core_jump"}
+
+# Suites that skip the VCD dump unless WAVES=1 is given, matching the
+# NO_WAVES define in their makefiles
+NO_WAVES_SUITES = {"test_rv32i_core_jump"}
+
+
+def tb_clock(module):
+    """Whether the suite runs with the clock generated in the testbench (TB_CLOCK)"""
+    if TB_CLOCK is None:
+        return module in TB_CLOCK_SUITES
+    return TB_CLOCK == "1"
+
+
+def cocotb_tests(module):
+    """List the names of the @cocotb.test() coroutines defined in a test module"""
+    tree = ast.parse((TB_DIR / f"{module}.py").read_text())
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.AsyncFunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
+            if ast.unparse(decorator) == "cocotb.test":
+                names.append(node.name)
+                break
+    return names
+
+
+def build_key(sources, defines, build_args):
+    """Hash the HDL sources, RTL headers, defines and simulator arguments of a build"""
+    digest = hashlib.blake2b(digest_size=6)
+    headers = sorted(RTL_DIR.glob("*.vh")) + sorted(RTL_DIR.glob("*.svh"))
+    for path in [*sources, *headers]:
+        digest.update(str(path).encode())
+        digest.update(Path(path).read_bytes())
+    digest.update(repr((SIM, sorted(defines.items()), build_args)).encode())
+    return digest.hexdigest()
+
+
+def build(module):
+    """Elaborate the suite's HDL (skipped when the build is up to date)
+
+    The build directory is keyed by a hash of everything that goes into the
+    elaboration, so switching SIM, TB_CLOCK, WAVES or branches reuses any earlier
+    build of the same inputs instead of recompiling over it.
+    """
+    toplevel, sources = SUITES[module]
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+    build_args = []
+    if SIM == "icarus":
+        build_args.append("-g2012")
+    elif SIM == "verilator":
+        build_args += ["-O3", "--x-assign", "fast", "--x-initial", "fast", "--public-flat-rw"]
+
+    defines = {"SIMULATION": 1}
+    if tb_clock(module):
+        defines["TB_CLOCK"] = 1
+    if module in NO_WAVES_SUITES and os.environ.get("WAVES") != "1":
+        defines["NO_WAVES"] = 1
+    if SIM == "verilator" and (tb_clock(module) or toplevel in CLOCKED_TESTBENCHES):
+        build_args.append("--timing")
+
+    key = build_key(sources, defines, build_args)
+    build_dir = PROJECT_ROOT / "sim_build" / f"{module}_{SIM}_{key}_{worker}"
+
+    runner = get_runner(SIM)
+    runner.build(
+        sources=sources,
+        hdl_toplevel=toplevel,
+        includes=[RTL_DIR],
+        defines=defines,
+        build_args=build_args,
+        build_dir=build_dir,
+        always=False,
+    )
+    return runner, build_dir
+
+
+CASES = [(module, name) for module in SUITES for name in cocotb_tests(module)]
+
+
+@pytest.mark.parametrize("module,testcase", CASES, ids=[f"{m}::{t}" for m, t in CASES])
+def test_cocotb(module, testcase):
+    runner, build_dir = build(module)
+    toplevel, _ = SUITES[module]
+    results_xml = build_dir / f"results_{testcase}.xml"
+
+    runner.test(
+        test_module=module,
+        hdl_toplevel=toplevel,
+        build_dir=build_dir,
+        test_dir=TB_DIR,
+        test_filter=rf"(^|\.){testcase}\b",
+        results_xml=results_xml,
+        extra_env={
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(TB_DIR), os.environ.get("PYTHONPATH")])),
+            "TB_CLOCK": "1" if tb_clock(module) else "0",
+        },
+    )
+
+    num_tests, num_failed = get_results(results_xml)
+    assert num_tests > 0, f"{module}.{testcase} did not run"
+    assert num_failed == 0, f"{module}.{testcase}: {num_failed} of {num_tests} failed"
@@ -23,10 +23,7 @@ def convert_hex_memory_to_byte_memory(hex_memory):
     """Convert hex memory to byte memory"""
     byte_memory = bytearray(32 * 1024 * 1024)
     for addr, value in hex_memory.items():
-        byte_memory[addr] = value & 0xFF
-        byte_memory[addr + 1] = (value >> 8) & 0xFF
-        byte_memory[addr + 2] = (value >> 16) & 0xFF
-        byte_memory[addr + 3] = (value >> 24) & 0xFF
+        byte_memory[addr:addr + 4] = (value & 0xFFFFFFFF).to_bytes(4, "little")
     return byte_memory
 
 def load_bin_file(bin_file_path):
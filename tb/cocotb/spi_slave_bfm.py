@@ -13,7 +13,7 @@ MSB first for all modes.
 """
 
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge, Timer
+from cocotb.triggers import RisingEdge, FallingEdge, Timer, First, Event
 
 
 def safe_int(value, default=0):
@@ -79,6 +79,7 @@ class SPISlaveBFM:
         self.rx_buffer = []  # Received data from MOSI
         self.tx_buffer = []  # Data to transmit on MISO
         self.running = False
+        self._stop_event = Event()  # Wakes run() when stop() is called while CS is idle
         self.current_tx_byte = 0xFF  # Default: send 0xFF if no data configured
         
         # Transfer state
@@ -148,6 +149,7 @@ class SPISlaveBFM:
         This should be started as a background task using cocotb.start_soon()
         """
         self.running = True
+        self._stop_event.clear()
         
         # Initialize MISO to 0 (or high-Z equivalent)
         self.miso.value = 0
@@ -227,10 +229,18 @@ class SPISlaveBFM:
             # Update previous values
             self.prev_sclk = current_sclk
             self.prev_cs_n = current_cs_n
-    
+
+            # Nothing happens on the bus while CS is inactive: sleep until it
+            # is asserted (or the BFM is stopped) instead of sampling every
+            # clock. The next clock edge then sees the start of the transfer
+            # as before.
+            if current_cs_n == 1:
+                await First(FallingEdge(self.cs_n), self._stop_event.wait())
+
     def stop(self):
         """Stop the BFM"""
         self.running = False
+        self._stop_event.set()
         self.miso.value = 0
     
     async def wait_for_transfer(self, timeout_cycles=10000):
@@ -61,11 +61,11 @@ async def test_csrrw1(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0x234, f"Register x2 should be 0x234, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0x0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-            assert registers[4].value == 0x123, f"Register x4 should be 0x123, got 0x{registers[4].value.integer:08x}"
-            assert csr.mscratch.value == 0x234, f"CSR mscratch should be 0x234, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0x234, f"Register x2 should be 0x234, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0x0, f"Register x3 should be 0, got 0x{registers[3].value.to_unsigned():08x}"
+            assert registers[4].value == 0x123, f"Register x4 should be 0x123, got 0x{registers[4].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x234, f"CSR mscratch should be 0x234, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -104,11 +104,11 @@ async def test_csrrw2(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0x234, f"Register x2 should be 0x234, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0x0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-            assert registers[4].value == 0x123, f"Register x4 should be 0x123, got 0x{registers[4].value.integer:08x}"
-            assert csr.mscratch.value == 0x234, f"CSR mscratch should be 0x234, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0x234, f"Register x2 should be 0x234, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0x0, f"Register x3 should be 0, got 0x{registers[3].value.to_unsigned():08x}"
+            assert registers[4].value == 0x123, f"Register x4 should be 0x123, got 0x{registers[4].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x234, f"CSR mscratch should be 0x234, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -140,9 +140,9 @@ async def test_csrrw3(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -174,9 +174,9 @@ async def test_csrrw4(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -208,10 +208,10 @@ async def test_csrrw5(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -247,10 +247,10 @@ async def test_csrrw6(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -290,11 +290,11 @@ async def test_csrrw7(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.integer:08x}"
-            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.to_unsigned():08x}"
+            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -337,11 +337,11 @@ async def test_csrrw8(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.integer:08x}"
-            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.to_unsigned():08x}"
+            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -377,10 +377,10 @@ async def test_csrrw9(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -420,11 +420,11 @@ async def test_csrrw10(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.integer:08x}"
-            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.to_unsigned():08x}"
+            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -467,11 +467,11 @@ async def test_csrrw11(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.integer:08x}"
-            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.integer:08x}"
-            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.integer:08x}"
-            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[1].value == 0x123, f"Register x1 should be 0x123, got 0x{registers[1].value.to_unsigned():08x}"
+            assert registers[2].value == 0x123, f"Register x2 should be 0x123, got 0x{registers[2].value.to_unsigned():08x}"
+            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.to_unsigned():08x}"
+            assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x123, f"CSR mscratch should be 0x123, got 0x{csr.mscratch.value.to_unsigned():08x}"
 
             return True
         return False
@@ -503,8 +503,8 @@ async def test_csrrs(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
 
-            assert registers[2].value == 0x5, f"Register x2 (CSRRS read) should be 0x5, got 0x{registers[2].value.integer:08x}"
-            assert csr.mscratch.value == 0x7, f"CSR mscratch should be 0x7, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[2].value == 0x5, f"Register x2 (CSRRS read) should be 0x5, got 0x{registers[2].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x7, f"CSR mscratch should be 0x7, got 0x{csr.mscratch.value.to_unsigned():08x}"
             
             return True
         return False
@@ -537,8 +537,8 @@ async def test_csrrc(dut):
             registers = dut.soc_inst.cpu_core.register_file.registers
             csr = dut.soc_inst.cpu_core.csr_file
             
-            assert registers[2].value == 0x7, f"Register x2 (CSRRC read) should be 0x7, got 0x{registers[2].value.integer:08x}"
-            assert csr.mscratch.value == 0x4, f"CSR mscratch should be 0x4, got 0x{csr.mscratch.value.integer:08x}"
+            assert registers[2].value == 0x7, f"Register x2 (CSRRC read) should be 0x7, got 0x{registers[2].value.to_unsigned():08x}"
+            assert csr.mscratch.value == 0x4, f"CSR mscratch should be 0x4, got 0x{csr.mscratch.value.to_unsigned():08x}"
             
             return True
         return False
@@ -630,34 +630,34 @@ async def test_csr_instr(dut):
             # Note: Register x0 is always 0, so CSRRW with x0 as source doesn't write
             
             # Verify CSRRW result: x4 should be 0 (initial mscratch value)
-            assert registers[4].value == 0, f"Register x4 (CSRRW read) should be 0, got 0x{registers[4].value.integer:08x}"
+            assert registers[4].value == 0, f"Register x4 (CSRRW read) should be 0, got 0x{registers[4].value.to_unsigned():08x}"
             
             # Verify CSRRS result: x5 should be 0x123 (mscratch after CSRRW)
-            assert registers[5].value == 0x123, f"Register x5 (CSRRS read) should be 0x123, got 0x{registers[5].value.integer:08x}"
+            assert registers[5].value == 0x123, f"Register x5 (CSRRS read) should be 0x123, got 0x{registers[5].value.to_unsigned():08x}"
             
             # Verify CSRRC result: x6 should be 0x123 (mscratch after CSRRS)
-            assert registers[6].value == 0x123, f"Register x6 (CSRRC read) should be 0x123, got 0x{registers[6].value.integer:08x}"
+            assert registers[6].value == 0x123, f"Register x6 (CSRRC read) should be 0x123, got 0x{registers[6].value.to_unsigned():08x}"
             
             # Verify CSRRWI result: x7 should be 0 (mscratch after CSRRC)
-            assert registers[7].value == 0, f"Register x7 (CSRRWI read) should be 0, got 0x{registers[7].value.integer:08x}"
+            assert registers[7].value == 0, f"Register x7 (CSRRWI read) should be 0, got 0x{registers[7].value.to_unsigned():08x}"
             
             # Verify CSRRSI result: x8 should be 5 (mscratch after CSRRWI)
-            assert registers[8].value == 5, f"Register x8 (CSRRSI read) should be 5, got 0x{registers[8].value.integer:08x}"
+            assert registers[8].value == 5, f"Register x8 (CSRRSI read) should be 5, got 0x{registers[8].value.to_unsigned():08x}"
             
             # Verify CSRRCI result: x9 should be 7 (mscratch after CSRRSI)
-            assert registers[9].value == 7, f"Register x9 (CSRRCI read) should be 7, got 0x{registers[9].value.integer:08x}"
+            assert registers[9].value == 7, f"Register x9 (CSRRCI read) should be 7, got 0x{registers[9].value.to_unsigned():08x}"
             
             # Verify mstatus read: x10 should be 0x00001800 (reset value)
-            assert registers[10].value == 0x00001800, f"Register x10 (mstatus) should be 0x00001800, got 0x{registers[10].value.integer:08x}"
+            assert registers[10].value == 0x00001800, f"Register x10 (mstatus) should be 0x00001800, got 0x{registers[10].value.to_unsigned():08x}"
             
             # Verify misa read: x11 should be 0x40000104 (reset value)
-            assert registers[11].value == 0x40000104, f"Register x11 (misa) should be 0x40000104, got 0x{registers[11].value.integer:08x}"
+            assert registers[11].value == 0x40000104, f"Register x11 (misa) should be 0x40000104, got 0x{registers[11].value.to_unsigned():08x}"
             
             # Verify mtvec read: x12 should be 0 (initial value)
-            assert registers[12].value == 0, f"Register x12 (mtvec initial) should be 0, got 0x{registers[12].value.integer:08x}"
+            assert registers[12].value == 0, f"Register x12 (mtvec initial) should be 0, got 0x{registers[12].value.to_unsigned():08x}"
             
             # Verify mtvec write and read: x13 should be 0 (old mtvec), new mtvec = 0x100
-            assert registers[13].value == 0, f"Register x13 (mtvec old) should be 0, got 0x{registers[13].value.integer:08x}"
+            assert registers[13].value == 0, f"Register x13 (mtvec old) should be 0, got 0x{registers[13].value.to_unsigned():08x}"
             
             return True
         return False
@@ -6,8 +6,7 @@ Python test for RISC-V C Extension
 import cocotb
 from cocotb.triggers import RisingEdge, Timer
 from cocotb.clock import Clock
-import test_utils
-from test_utils import do_test, CYCLES_PER_INSTRUCTION, NOP_INSTR
+from test_utils import do_test, mem_capture, check_registers, CYCLES_PER_INSTRUCTION, NOP_INSTR
 
 @cocotb.test()
 async def test_c_add(dut):
@@ -36,11 +35,12 @@ async def test_c_add(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
-    # After c.add x9, x10: x9 = x9 + x10 = 1 + 2 = 3
-    assert registers[9].value == 3, f"Register x9 should be 3, got 0x{registers[9].value.integer:08x}"
-    # x10 should remain unchanged
-    assert registers[10].value == 2, f"Register x10 should be 2, got 0x{registers[10].value.integer:08x}"
+    check_registers(dut, {
+        # After c.add x9, x10: x9 = x9 + x10 = 1 + 2 = 3
+        9: 3,
+        # x10 should remain unchanged
+        10: 2,
+    })
 
 @cocotb.test()
 async def test_c_addi4spn(dut):
@@ -60,10 +60,11 @@ async def test_c_addi4spn(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
-    # After c.addi4spn x8, 4: x8 = x2 + 4 = 0x100 + 4 = 0x104
-    assert registers[2].value == 0x100, f"Register x2 (sp) should be 0x100, got 0x{registers[2].value.integer:08x}"
-    assert registers[8].value == 0x104, f"Register x8 should be 0x104, got 0x{registers[8].value.integer:08x}"
+    check_registers(dut, {
+        # After c.addi4spn x8, 4: x8 = x2 + 4 = 0x100 + 4 = 0x104
+        2: 0x100,
+        8: 0x104,
+    })
 
 @cocotb.test()
 async def test_c_lw(dut):
@@ -84,9 +85,8 @@ async def test_c_lw(dut):
     }
     await do_test(dut, memory, 15, 0xABCD)
     
-    registers = dut.core.register_file.registers
     # After c.lw x8, 4(x9): x8 = MEM[x9 + 4] = MEM[0x00000024] = 0xABCD
-    assert registers[8].value == 0xABCD, f"Register x8 should be 0xABCD, got 0x{registers[8].value.integer:08x}"
+    check_registers(dut, {8: 0xABCD})
 
 @cocotb.test()
 async def test_c_sw(dut):
@@ -110,11 +110,11 @@ async def test_c_sw(dut):
     }
     await do_test(dut, memory, 10, 0)
     
-    # Check that memory write occurred (via test_utils memory tracking)
-    import test_utils
-    assert test_utils.mem_addr == 0x304, f"Mem_Addr should be 0x304, got 0x{test_utils.mem_addr:08x}"
-    assert test_utils.mem_wdata == 0x123456, f"Mem_wdata should be 0x123456, got 0x{test_utils.mem_wdata:08x}"
-    assert test_utils.mem_flag == 0b010, f"Mem_flag should be 0b010, got 0b{test_utils.mem_flag:03b}"
+    # Check that memory write occurred (via the do_test memory capture)
+    assert mem_capture.addr is not None, "No memory write completed"
+    assert mem_capture.addr == 0x304, f"Mem_Addr should be 0x304, got 0x{mem_capture.addr:08x}"
+    assert mem_capture.wdata == 0x123456, f"Mem_wdata should be 0x123456, got 0x{mem_capture.wdata:08x}"
+    assert mem_capture.flag == 0b010, f"Mem_flag should be 0b010, got 0b{mem_capture.flag:03b}"
 
 @cocotb.test()
 async def test_c_addi(dut):
@@ -134,9 +134,8 @@ async def test_c_addi(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.addi x1, 5: x1 = x1 + 5 = 3 + 5 = 8
-    assert registers[1].value == 8, f"Register x1 should be 8, got 0x{registers[1].value.integer:08x}"
+    check_registers(dut, {1: 8})
 
 @cocotb.test()
 async def test_c_nop(dut):
@@ -155,9 +154,8 @@ async def test_c_nop(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # x1 should remain unchanged after C.NOP
-    assert registers[1].value == 5, f"Register x1 should be 5, got 0x{registers[1].value.integer:08x}"
+    check_registers(dut, {1: 5})
 
 @cocotb.test()
 async def test_c_li(dut):
@@ -176,9 +174,8 @@ async def test_c_li(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.li x1, 5: x1 = 5
-    assert registers[1].value == 5, f"Register x1 should be 5, got 0x{registers[1].value.integer:08x}"
+    check_registers(dut, {1: 5})
 
 @cocotb.test()
 async def test_c_lui(dut):
@@ -197,9 +194,8 @@ async def test_c_lui(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.lui x1, 7: x1 = 7 << 12 = 0x00007000
-    assert registers[1].value == 0x00007000, f"Register x1 should be 0x00007000, got 0x{registers[1].value.integer:08x}"
+    check_registers(dut, {1: 0x00007000})
 
 @cocotb.test()
 async def test_c_addi16sp(dut):
@@ -219,9 +215,8 @@ async def test_c_addi16sp(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.addi16sp 32: x2 = x2 + 32 = 0x100 + 32 = 0x120
-    assert registers[2].value == 0x120, f"Register x2 should be 0x120, got 0x{registers[2].value.integer:08x}"
+    check_registers(dut, {2: 0x120})
 
 @cocotb.test()
 async def test_c_srli(dut):
@@ -241,9 +236,8 @@ async def test_c_srli(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.srli x9, 1: x9 = x9 >> 1 = 8 >> 1 = 4
-    assert registers[9].value == 4, f"Register x9 should be 4, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 4})
 
 @cocotb.test()
 async def test_c_srai(dut):
@@ -263,9 +257,8 @@ async def test_c_srai(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.srai x9, 1: x9 = x9 >>> 1 = 0xFFFFFFFF >>> 1 = 0xFFFFFFFF (arithmetic shift preserves sign)
-    assert registers[9].value == 0xFFFFFFFF, f"Register x9 should be 0xFFFFFFFF, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 0xFFFFFFFF})
 
 @cocotb.test()
 async def test_c_andi(dut):
@@ -285,9 +278,8 @@ async def test_c_andi(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.andi x9, 1: x9 = x9 & 1 = 15 & 1 = 1
-    assert registers[9].value == 1, f"Register x9 should be 1, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 1})
 
 @cocotb.test()
 async def test_c_sub(dut):
@@ -308,9 +300,8 @@ async def test_c_sub(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.sub x9, x8: x9 = x9 - x8 = 10 - 3 = 7
-    assert registers[9].value == 7, f"Register x9 should be 7, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 7})
 
 @cocotb.test()
 async def test_c_xor(dut):
@@ -331,9 +322,8 @@ async def test_c_xor(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.xor x9, x8: x9 = x9 ^ x8 = 15 ^ 3 = 12 (0b1111 ^ 0b0011 = 0b1100)
-    assert registers[9].value == 12, f"Register x9 should be 12, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 12})
 
 @cocotb.test()
 async def test_c_or(dut):
@@ -354,9 +344,8 @@ async def test_c_or(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.or x9, x8: x9 = x9 | x8 = 10 | 3 = 11 (0b1010 | 0b0011 = 0b1011)
-    assert registers[9].value == 11, f"Register x9 should be 11, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 11})
 
 @cocotb.test()
 async def test_c_and(dut):
@@ -377,9 +366,8 @@ async def test_c_and(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.and x9, x8: x9 = x9 & x8 = 15 & 3 = 3 (0b1111 & 0b0011 = 0b0011)
-    assert registers[9].value == 3, f"Register x9 should be 3, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 3})
 
 @cocotb.test()
 async def test_c_slli(dut):
@@ -399,9 +387,8 @@ async def test_c_slli(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.slli x9, 3: x9 = x9 << 3 = 2 << 3 = 16
-    assert registers[9].value == 16, f"Register x9 should be 16, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 16})
 
 @cocotb.test()
 async def test_c_lwsp(dut):
@@ -422,9 +409,8 @@ async def test_c_lwsp(dut):
     }
     await do_test(dut, memory, 15, 0x12345678)
     
-    registers = dut.core.register_file.registers
     # After c.lwsp x9, 28(x2): x9 = MEM[x2 + 28] = MEM[0x11C] = 0x12345678
-    assert registers[9].value == 0x12345678, f"Register x9 should be 0x12345678, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 0x12345678})
 
 @cocotb.test()
 async def test_c_mv(dut):
@@ -444,9 +430,8 @@ async def test_c_mv(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
     # After c.mv x9, x10: x9 = x10 = 10
-    assert registers[9].value == 10, f"Register x9 should be 10, got 0x{registers[9].value.integer:08x}"
+    check_registers(dut, {9: 10})
 
 @cocotb.test()
 async def test_c_jr(dut):
@@ -472,16 +457,17 @@ async def test_c_jr(dut):
     }
     await do_test(dut, memory, 12)
     
-    registers = dut.core.register_file.registers
-    # After c.jr x9, PC should jump to address in x9 (0x00000010)
-    # x0 should always be 0
-    assert registers[0].value == 0, f"Register x0 should always be 0, got 0x{registers[0].value.integer:08x}"
-    # x1 should be 0 (instruction at 0x0000000C should not be executed due to jump)
-    assert registers[1].value == 0, f"Register x1 should be 0, got 0x{registers[1].value.integer:08x}"
-    # x2, x3, x4 should be set by instructions at target address
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+    check_registers(dut, {
+        # After c.jr x9, PC should jump to address in x9 (0x00000010)
+        # x0 should always be 0
+        0: 0,
+        # x1 should be 0 (instruction at 0x0000000C should not be executed due to jump)
+        1: 0,
+        # x2, x3, x4 should be set by instructions at target address
+        2: 2,
+        3: 3,
+        4: 4,
+    })
 
 @cocotb.test()
 async def test_c_jalr(dut):
@@ -505,16 +491,17 @@ async def test_c_jalr(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
-    # After c.jalr x9, x1 should contain return address (PC+2 of compressed instruction = 0x0000000A)
-    # Note: C.JALR is at 0x00000008 (16-bit), so return address = 0x00000008 + 2 = 0x0000000A
-    assert registers[1].value == 0x0000000A, f"Register x1 should be 0x0000000A (return address), got 0x{registers[1].value.integer:08x}"
-    assert registers[9].value == 0x00000010, f"Register x9 should be 0x00000010, got 0x{registers[9].value.integer:08x}"
-    # x3 should be 0 (instruction at 0x0000000C should not be executed initially)
-    assert registers[3].value == 0, f"Register x3 should be 0 (not executed), got 0x{registers[3].value.integer:08x}"
-    # x4, x5 should be set by instructions at target address
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 5, f"Register x5 should be 5, got 0x{registers[5].value.integer:08x}"
+    check_registers(dut, {
+        # After c.jalr x9, x1 should contain return address (PC+2 of compressed instruction = 0x0000000A)
+        # Note: C.JALR is at 0x00000008 (16-bit), so return address = 0x00000008 + 2 = 0x0000000A
+        1: 0x0000000A,
+        9: 0x00000010,
+        # x3 should be 0 (instruction at 0x0000000C should not be executed initially)
+        3: 0,
+        # x4, x5 should be set by instructions at target address
+        4: 4,
+        5: 5,
+    })
 
 @cocotb.test()
 async def test_c_swsp(dut):
@@ -538,11 +525,11 @@ async def test_c_swsp(dut):
     }
     await do_test(dut, memory, 10, 0)
     
-    # Check that memory write occurred (via test_utils memory tracking)
-    import test_utils
-    assert test_utils.mem_addr == 0x31C, f"Mem_Addr should be 0x31C, got 0x{test_utils.mem_addr:08x}"
-    assert test_utils.mem_wdata == 0x123456, f"Mem_wdata should be 0x123456, got 0x{test_utils.mem_wdata:08x}"
-    assert test_utils.mem_flag == 0b010, f"Mem_flag should be 0b010, got 0b{test_utils.mem_flag:03b}"
+    # Check that memory write occurred (via the do_test memory capture)
+    assert mem_capture.addr is not None, "No memory write completed"
+    assert mem_capture.addr == 0x31C, f"Mem_Addr should be 0x31C, got 0x{mem_capture.addr:08x}"
+    assert mem_capture.wdata == 0x123456, f"Mem_wdata should be 0x123456, got 0x{mem_capture.wdata:08x}"
+    assert mem_capture.flag == 0b010, f"Mem_flag should be 0b010, got 0b{mem_capture.flag:03b}"
 
 @cocotb.test()
 async def test_c_beqz(dut):
@@ -566,13 +553,14 @@ async def test_c_beqz(dut):
     }
     await do_test(dut, memory, 12)
     
-    registers = dut.core.register_file.registers
-    # If branch is taken, x1 should remain 0 (not set to 1)
-    assert registers[1].value == 0, f"Register x1 should be 0, got 0x{registers[1].value.integer:08x}"
-    # x2, x3, x4 should be set by instructions at target address
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+    check_registers(dut, {
+        # If branch is taken, x1 should remain 0 (not set to 1)
+        1: 0,
+        # x2, x3, x4 should be set by instructions at target address
+        2: 2,
+        3: 3,
+        4: 4,
+    })
 
 @cocotb.test()
 async def test_c_bnez(dut):
@@ -596,15 +584,16 @@ async def test_c_bnez(dut):
     }
     await do_test(dut, memory, 12)
     
-    registers = dut.core.register_file.registers
-    # x9 should remain 5
-    assert registers[9].value == 5, f"Register x9 should be 5, got 0x{registers[9].value.integer:08x}"
-    # If branch is taken, x1 should remain 0 (not set to 1)
-    assert registers[1].value == 0, f"Register x1 should be 0, got 0x{registers[1].value.integer:08x}"
-    # x2, x3, x4 should be set by instructions at target address
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+    check_registers(dut, {
+        # x9 should remain 5
+        9: 5,
+        # If branch is taken, x1 should remain 0 (not set to 1)
+        1: 0,
+        # x2, x3, x4 should be set by instructions at target address
+        2: 2,
+        3: 3,
+        4: 4,
+    })
 
 @cocotb.test()
 async def test_c_j(dut):
@@ -628,15 +617,16 @@ async def test_c_j(dut):
     }
     await do_test(dut, memory, 12)
     
-    registers = dut.core.register_file.registers
-    # x0 should always be 0
-    assert registers[0].value == 0, f"Register x0 should always be 0, got 0x{registers[0].value.integer:08x}"
-    # x1 should be 0 (instruction at 0x00000008 should not be executed due to jump)
-    assert registers[1].value == 0, f"Register x1 should be 0, got 0x{registers[1].value.integer:08x}"
-    # x2, x3, x4 should be set by instructions at target address
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+    check_registers(dut, {
+        # x0 should always be 0
+        0: 0,
+        # x1 should be 0 (instruction at 0x00000008 should not be executed due to jump)
+        1: 0,
+        # x2, x3, x4 should be set by instructions at target address
+        2: 2,
+        3: 3,
+        4: 4,
+    })
 
 @cocotb.test()
 async def test_c_jal(dut):
@@ -660,15 +650,16 @@ async def test_c_jal(dut):
     }
     await do_test(dut, memory, 12)
     
-    registers = dut.core.register_file.registers
-    # After c.jal, x1 should contain return address (PC+2 of compressed instruction = 0x0000000A)
-    # Note: C.JAL is at 0x00000008 (16-bit), so return address = 0x00000008 + 2 = 0x0000000A
-    # x1 should be 0x0000000A (return address), NOT 0x0000000B (which would be if ADDI at 0x0000000C was executed)
-    assert registers[1].value == 0x0000000A, f"Register x1 should be 0x0000000A (return address), got 0x{registers[1].value.integer:08x}"
-    # x2, x3, x4 should be set by instructions at target address
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+    check_registers(dut, {
+        # After c.jal, x1 should contain return address (PC+2 of compressed instruction = 0x0000000A)
+        # Note: C.JAL is at 0x00000008 (16-bit), so return address = 0x00000008 + 2 = 0x0000000A
+        # x1 should be 0x0000000A (return address), NOT 0x0000000B (which would be if ADDI at 0x0000000C was executed)
+        1: 0x0000000A,
+        # x2, x3, x4 should be set by instructions at target address
+        2: 2,
+        3: 3,
+        4: 4,
+    })
 
 @cocotb.test()
 async def test_c_ebreak(dut):
@@ -688,7 +679,8 @@ async def test_c_ebreak(dut):
     }
     await do_test(dut, memory, 10)
     
-    registers = dut.core.register_file.registers
-    # x1 should remain 5 (ebreak should trigger exception/trap)
-    assert registers[1].value == 5, f"Register x1 should be 5, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
\ No newline at end of file
+    check_registers(dut, {
+        # x1 should remain 5 (ebreak should trigger exception/trap)
+        1: 5,
+        2: 0,
+    })
\ No newline at end of file
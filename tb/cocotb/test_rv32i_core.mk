@@ -12,7 +12,26 @@ VERILOG_SOURCES += $(PWD)/rtl/rv32i_csr.v
 VERILOG_SOURCES += $(PWD)/rtl/rv32c_decompress.v
 VERILOG_SOURCES += $(PWD)/tb/cocotb/test_rv32i_core_tb.sv
 
-COMPILE_ARGS += -g2012 -I$(PWD)/rtl -DSIMULATION
+COMPILE_ARGS += -I$(PWD)/rtl -DSIMULATION
+
+ifeq ($(SIM),icarus)
+COMPILE_ARGS += -g2012
+endif
+
+# Verilator: the tests only check register and memory values, so no trace
+# is built; --public-flat-rw keeps core.register_file.registers visible
+ifeq ($(SIM),verilator)
+EXTRA_ARGS += -O3 --x-assign fast --x-initial fast --public-flat-rw
+endif
+
+# TB_CLOCK=1 generates clk inside the testbench instead of from Python
+ifeq ($(TB_CLOCK),1)
+COMPILE_ARGS += -DTB_CLOCK
+export TB_CLOCK
+ifeq ($(SIM),verilator)
+EXTRA_ARGS += --timing
+endif
+endif
 
 # Top level module
 TOPLEVEL = test_rv32i_core_tb
@@ -12,7 +12,34 @@ VERILOG_SOURCES += $(PWD)/rtl/rv32i_csr.v
 VERILOG_SOURCES += $(PWD)/rtl/rv32c_decompress.v
 VERILOG_SOURCES += $(PWD)/tb/cocotb/test_rv32i_core_tb.sv
 
-COMPILE_ARGS += -g2012 -I$(PWD)/rtl -DSIMULATION
+COMPILE_ARGS += -I$(PWD)/rtl -DSIMULATION
+
+ifeq ($(SIM),icarus)
+COMPILE_ARGS += -g2012
+endif
+
+# Verilator: the tests only check register and memory values, so no trace
+# is built; --public-flat-rw keeps core.register_file.registers visible
+ifeq ($(SIM),verilator)
+EXTRA_ARGS += -O3 --x-assign fast --x-initial fast --public-flat-rw
+endif
+
+# The jump tests only check register values, so no VCD is written unless
+# WAVES=1 is given
+ifneq ($(WAVES),1)
+COMPILE_ARGS += -DNO_WAVES
+endif
+
+# The jump tests only need a free-running clock, so it is generated in the
+# testbench by default (TB_CLOCK=0 goes back to the Python clock)
+TB_CLOCK ?= 1
+ifeq ($(TB_CLOCK),1)
+COMPILE_ARGS += -DTB_CLOCK
+export TB_CLOCK
+ifeq ($(SIM),verilator)
+EXTRA_ARGS += --timing
+endif
+endif
 
 # Top level module
 TOPLEVEL = test_rv32i_core_tb
@@ -23,6 +50,10 @@ export PYTHONPATH := $(PWD)/tb/cocotb:$(PYTHONPATH)
 # Module name
 MODULE = test_rv32i_core_jump
 
+# Only warnings and failures are logged; results.xml still records every
+# test (override with COCOTB_LOG_LEVEL=INFO)
+export COCOTB_LOG_LEVEL ?= WARNING
+
 # Set a unique build directory for this test
 SIM_BUILD = sim_build_core_jump
 
@@ -1,644 +1,416 @@
-import cocotb
-from test_utils import do_test, NOP_INSTR
-
-@cocotb.test()
-async def test_beq_1(dut):
-    """Test BEQ (Branch if Equal): jump"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x002080E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
-        0x00000008: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x0000000C: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000014: ADDI_INSTR,
-        0x00000018: ADDI_INSTR,
-        0x0000001C: ADDI_INSTR,
-        0x00000800: ADDI_INSTR,
-        0x00000804: 0x00210113, # ADDI x2, x2, 2 => it should be executed
-        0x00000808: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x0000080C: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000810: NOP_INSTR,
-        0x00000814: NOP_INSTR,
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-    }
-    await do_test(dut, memory, 10)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0, f"Register x1 should still be 0, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-
-@cocotb.test()
-async def test_beq_2(dut):
-    """Test BEQ (Branch if Equal): no jump"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00508093, # ADDI x1, x1, 5
-        0x00000008: 0x002080E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
-        0x0000000C: 0x00108093, # ADDI x1, x1, 0x01 => it should be executed
-        0x00000010: 0x00208093, # ADDI x1, x1, 0x02
-        0x00000014: 0x00408093, # ADDI x1, x1, 0x04
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-        0x00000804: NOP_INSTR,
-        0x00000808: 0x00210113, # ADDI x2, x2, 2 => it should not be executed
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should not be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should not be executed
-        0x00000814: NOP_INSTR,
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-    }
-    await do_test(dut, memory, 12)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0xC, f"Register x1 should be 0xC, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-
-@cocotb.test()
-async def test_bne_1(dut):
-    """Test BNE (Branch if Not Equal)"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00508093, # ADDI x1, x1, 5
-        0x00000008: 0x002090E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
-        0x0000000C: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000014: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000018: ADDI_INSTR,
-        0x0000001C: ADDI_INSTR,
-        0x00000804: ADDI_INSTR,
-        0x00000808: 0x00210113, # ADDI x2, x2, 2 => it should be executed
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000814: NOP_INSTR,
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-    }
-    await do_test(dut, memory, 12)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 5, f"Register x1 should be 5, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-
-@cocotb.test()
-async def test_bne_2(dut):
-    """Test BNE (Branch if Not Equal)"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: NOP_INSTR,
-        0x00000008: 0x002090E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
-        0x0000000C: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000014: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-        0x00000804: ADDI_INSTR,
-        0x00000808: 0x00210113, # ADDI x2, x2, 2 => it should be executed
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000814: NOP_INSTR,
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-    }
-    await do_test(dut, memory, 12)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 3, f"Register x1 should be 3, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 0, f"Register x2 should be 0, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-
-@cocotb.test()
-async def test_blt_1(dut):
-    """Test BLT (Branch if Less Than, signed): jump when rs1 < rs2"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0xFFF08093, # ADDI x1, x1, -1 (signed)
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020C0E3, # BLT x1, x2, 0x800 => Jump to 0x00000804 (since -1 < 2)
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x00000014: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000018: ADDI_INSTR, # ADDI x1, x1, 1
-        0x0000001C: ADDI_INSTR,
-        0x00000020: ADDI_INSTR,
-        0x00000024: ADDI_INSTR,
-        0x00000028: ADDI_INSTR,
-        0x0000002C: ADDI_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000814: 0x00528293, # ADDI x5, x5, 5 => it should be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-        0x00000834: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0xFFFFFFFF, f"Register x1 should be -1, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 5, f"Register x5 should be 5, got 0x{registers[5].value.integer:08x}"
-
-@cocotb.test()
-async def test_blt_2(dut):
-    """Test BLT (Branch if Less Than, signed): no jump when rs1 >= rs2"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00508093, # ADDI x1, x1, 5
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020C0E3, # BLT x1, x2, 0x800 => Should not jump (since 5 >= 2)
-        0x00000010: 0x00108093, # ADDI x1, x1, 1 => it should be executed
-        0x00000014: 0x00208093, # ADDI x1, x1, 2
-        0x00000018: 0x00408093, # ADDI x1, x1, 4
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-        0x00000038: NOP_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00210113, # ADDI x2, x2, 2 => it should not be executed
-        0x00000810: 0x00318193, # ADDI x3, x3, 3 => it should not be executed
-        0x00000814: 0x00420213, # ADDI x4, x4, 4 => it should not be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR, # NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0xC, f"Register x1 should be 0xC, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 0, f"Register x5 should be 0, got 0x{registers[5].value.integer:08x}"
-
-@cocotb.test()
-async def test_bge_1(dut):
-    """Test BGE (Branch if Greater or Equal, signed): jump when rs1 >= rs2"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00508093, # ADDI x1, x1, 5
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020D0E3, # BGE x1, x2, 0x800 => Jump to 0x00000804 (since 5 >= 2)
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x00000014: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000018: ADDI_INSTR, # ADDI x1, x1, 1
-        0x0000001C: ADDI_INSTR,
-        0x00000020: ADDI_INSTR,
-        0x00000024: ADDI_INSTR,
-        0x00000028: ADDI_INSTR,
-        0x0000002C: ADDI_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000814: 0x00528293, # ADDI x5, x5, 5 => it should be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-        0x00000834: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 5, f"Register x1 should be 5, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 5, f"Register x5 should be 5, got 0x{registers[5].value.integer:08x}"
+from types import MappingProxyType
 
-@cocotb.test()
-async def test_bge_2(dut):
-    """Test BGE (Branch if Greater or Equal, signed): no jump when rs1 < rs2"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0xFFF08093, # ADDI x1, x1, -1 (signed)
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020D0E3, # BGE x1, x2, 0x800 => Should not jump (since -1 < 2)
-        0x00000010: 0x00108093, # ADDI x1, x1, 1 => it should be executed
-        0x00000014: 0x00208093, # ADDI x1, x1, 2
-        0x00000018: 0x00408093, # ADDI x1, x1, 4
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-        0x00000038: NOP_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00210113, # ADDI x2, x2, 2 => it should not be executed
-        0x00000810: 0x00318193, # ADDI x3, x3, 3 => it should not be executed
-        0x00000814: 0x00420213, # ADDI x4, x4, 4 => it should not be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 6, f"Register x1 should be 6, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 0, f"Register x5 should be 0, got 0x{registers[5].value.integer:08x}"
-
-@cocotb.test()
-async def test_bltu_1(dut):
-    """Test BLTU (Branch if Less Than, unsigned): jump when rs1 < rs2"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00108093, # ADDI x1, x1, 1
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020E0E3, # BLTU x1, x2, 0x800 => Jump to 0x00000804 (since 1 < 2)
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x00000014: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000018: ADDI_INSTR, # ADDI x1, x1, 1
-        0x0000001C: ADDI_INSTR,
-        0x00000020: ADDI_INSTR,
-        0x00000024: ADDI_INSTR,
-        0x00000028: ADDI_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000814: 0x00528293, # ADDI x5, x5, 5 => it should be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-        0x00000834: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 1, f"Register x1 should be 1, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 5, f"Register x5 should be 5, got 0x{registers[5].value.integer:08x}"
-
-@cocotb.test()
-async def test_bltu_2(dut):
-    """Test BLTU (Branch if Less Than, unsigned): no jump when rs1 >= rs2"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00508093, # ADDI x1, x1, 5
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020E0E3, # BLTU x1, x2, 0x800 => Should not jump (since 5 >= 2)
-        0x00000010: 0x00108093, # ADDI x1, x1, 1 => it should be executed
-        0x00000014: 0x00208093, # ADDI x1, x1, 2
-        0x00000018: 0x00408093, # ADDI x1, x1, 4
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-        0x00000038: NOP_INSTR,
-        0x00000804: NOP_INSTR,
-        0x0000080C: 0x00210113, # ADDI x2, x2, 2 => it should not be executed
-        0x00000810: 0x00318193, # ADDI x3, x3, 3 => it should not be executed
-        0x00000814: 0x00420213, # ADDI x4, x4, 4 => it should not be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0xC, f"Register x1 should be 0xC, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 0, f"Register x5 should be 0, got 0x{registers[5].value.integer:08x}"
-
-@cocotb.test()
-async def test_bgeu_1(dut):
-    """Test BGEU (Branch if Greater or Equal, unsigned): jump when rs1 >= rs2"""
-
-    ADDI_INSTR = 0x00108093
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00508093, # ADDI x1, x1, 5
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020F0E3, # BGEU x1, x2, 0x800 => Jump to 0x00000804 (since 5 >= 2)
-        0x00000010: ADDI_INSTR, # ADDI x1, x1, 1 => it should not be executed
-        0x00000014: ADDI_INSTR, # ADDI x1, x1, 1
-        0x00000018: ADDI_INSTR, # ADDI x1, x1, 1
-        0x0000001C: ADDI_INSTR,
-        0x00000020: ADDI_INSTR,
-        0x00000024: ADDI_INSTR,
-        0x00000028: ADDI_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00318193, # ADDI x3, x3, 3 => it should be executed
-        0x00000810: 0x00420213, # ADDI x4, x4, 4 => it should be executed
-        0x00000814: 0x00528293, # ADDI x5, x5, 5 => it should be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-        0x00000830: NOP_INSTR,
-        0x00000834: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 5, f"Register x1 should be 5, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 5, f"Register x5 should be 5, got 0x{registers[5].value.integer:08x}"
+import cocotb
+from test_utils import do_test, check_registers, encode_addi
+
+# Instructions shared by the branch and jump programs
+ADDI_X1_X1_1 = encode_addi(1, 1, 1)
+ADDI_X1_X1_2 = encode_addi(1, 1, 2)
+ADDI_X1_X1_4 = encode_addi(1, 1, 4)
+ADDI_X1_X1_5 = encode_addi(1, 1, 5)
+ADDI_X2_X2_2 = encode_addi(2, 2, 2)
+ADDI_X3_X3_3 = encode_addi(3, 3, 3)
+ADDI_X4_X4_4 = encode_addi(4, 4, 4)
+ADDI_X5_X5_5 = encode_addi(5, 5, 5)
+ADDI_X6_X6_6 = encode_addi(6, 6, 6)
+
+# Programs only list their instructions; do_test fetches NOPs everywhere else
+
+_MEM_BEQ_1 = MappingProxyType({
+    0x00000004: 0x002080E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
+    0x00000008: ADDI_X1_X1_1, # it should not be executed
+    0x0000000C: ADDI_X1_X1_1,
+    0x00000010: ADDI_X1_X1_1,
+    0x00000014: ADDI_X1_X1_1,
+    0x00000018: ADDI_X1_X1_1,
+    0x0000001C: ADDI_X1_X1_1,
+    0x00000800: ADDI_X1_X1_1,
+    0x00000804: ADDI_X2_X2_2, # it should be executed
+    0x00000808: ADDI_X3_X3_3, # it should be executed
+    0x0000080C: ADDI_X4_X4_4, # it should be executed
+})
+
+_EXPECT_BEQ_1 = MappingProxyType({
+    1: 0,
+    2: 2,
+    3: 3,
+    4: 4,
+})
+
+_MEM_BEQ_2 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_5,
+    0x00000008: 0x002080E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
+    0x0000000C: ADDI_X1_X1_1, # it should be executed
+    0x00000010: ADDI_X1_X1_2,
+    0x00000014: ADDI_X1_X1_4,
+    0x00000808: ADDI_X2_X2_2, # it should not be executed
+    0x0000080C: ADDI_X3_X3_3, # it should not be executed
+    0x00000810: ADDI_X4_X4_4, # it should not be executed
+})
+
+_EXPECT_BEQ_2 = MappingProxyType({
+    1: 0xC,
+    2: 0,
+    3: 0,
+    4: 0,
+})
+
+_MEM_BNE_1 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_5,
+    0x00000008: 0x002090E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
+    0x0000000C: ADDI_X1_X1_1, # it should not be executed
+    0x00000010: ADDI_X1_X1_1,
+    0x00000014: ADDI_X1_X1_1,
+    0x00000018: ADDI_X1_X1_1,
+    0x0000001C: ADDI_X1_X1_1,
+    0x00000804: ADDI_X1_X1_1,
+    0x00000808: ADDI_X2_X2_2, # it should be executed
+    0x0000080C: ADDI_X3_X3_3, # it should be executed
+    0x00000810: ADDI_X4_X4_4, # it should be executed
+})
+
+_EXPECT_BNE_1 = MappingProxyType({
+    1: 5,
+    2: 2,
+    3: 3,
+    4: 4,
+})
+
+_MEM_BNE_2 = MappingProxyType({
+    0x00000008: 0x002090E3, # BEQ x1, x2, 0x800 => Jump to 0x00000804 = 0x00000004 + 0x800
+    0x0000000C: ADDI_X1_X1_1, # it should not be executed
+    0x00000010: ADDI_X1_X1_1,
+    0x00000014: ADDI_X1_X1_1,
+    0x00000804: ADDI_X1_X1_1,
+    0x00000808: ADDI_X2_X2_2, # it should be executed
+    0x0000080C: ADDI_X3_X3_3, # it should be executed
+    0x00000810: ADDI_X4_X4_4, # it should be executed
+})
+
+_EXPECT_BNE_2 = MappingProxyType({
+    1: 3,
+    2: 0,
+    3: 0,
+    4: 0,
+})
+
+_MEM_BLT_1 = MappingProxyType({
+    0x00000004: 0xFFF08093, # ADDI x1, x1, -1 (signed)
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020C0E3, # BLT x1, x2, 0x800 => Jump to 0x00000804 (since -1 < 2)
+    0x00000010: ADDI_X1_X1_1, # it should not be executed
+    0x00000014: ADDI_X1_X1_1,
+    0x00000018: ADDI_X1_X1_1,
+    0x0000001C: ADDI_X1_X1_1,
+    0x00000020: ADDI_X1_X1_1,
+    0x00000024: ADDI_X1_X1_1,
+    0x00000028: ADDI_X1_X1_1,
+    0x0000002C: ADDI_X1_X1_1,
+    0x0000080C: ADDI_X3_X3_3, # it should be executed
+    0x00000810: ADDI_X4_X4_4, # it should be executed
+    0x00000814: ADDI_X5_X5_5, # it should be executed
+})
+
+_EXPECT_BLT_1 = MappingProxyType({
+    1: 0xFFFFFFFF,
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+})
+
+_MEM_BLT_2 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_5,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020C0E3, # BLT x1, x2, 0x800 => Should not jump (since 5 >= 2)
+    0x00000010: ADDI_X1_X1_1, # it should be executed
+    0x00000014: ADDI_X1_X1_2,
+    0x00000018: ADDI_X1_X1_4,
+    0x0000080C: ADDI_X2_X2_2, # it should not be executed
+    0x00000810: ADDI_X3_X3_3, # it should not be executed
+    0x00000814: ADDI_X4_X4_4, # it should not be executed
+})
+
+_EXPECT_BLT_2 = MappingProxyType({
+    1: 0xC,
+    2: 2,
+    3: 0,
+    4: 0,
+    5: 0,
+})
+
+_MEM_BGE_1 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_5,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020D0E3, # BGE x1, x2, 0x800 => Jump to 0x00000804 (since 5 >= 2)
+    0x00000010: ADDI_X1_X1_1, # it should not be executed
+    0x00000014: ADDI_X1_X1_1,
+    0x00000018: ADDI_X1_X1_1,
+    0x0000001C: ADDI_X1_X1_1,
+    0x00000020: ADDI_X1_X1_1,
+    0x00000024: ADDI_X1_X1_1,
+    0x00000028: ADDI_X1_X1_1,
+    0x0000002C: ADDI_X1_X1_1,
+    0x0000080C: ADDI_X3_X3_3, # it should be executed
+    0x00000810: ADDI_X4_X4_4, # it should be executed
+    0x00000814: ADDI_X5_X5_5, # it should be executed
+})
+
+_EXPECT_BGE_1 = MappingProxyType({
+    1: 5,
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+})
+
+_MEM_BGE_2 = MappingProxyType({
+    0x00000004: 0xFFF08093, # ADDI x1, x1, -1 (signed)
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020D0E3, # BGE x1, x2, 0x800 => Should not jump (since -1 < 2)
+    0x00000010: ADDI_X1_X1_1, # it should be executed
+    0x00000014: ADDI_X1_X1_2,
+    0x00000018: ADDI_X1_X1_4,
+    0x0000080C: ADDI_X2_X2_2, # it should not be executed
+    0x00000810: ADDI_X3_X3_3, # it should not be executed
+    0x00000814: ADDI_X4_X4_4, # it should not be executed
+})
+
+_EXPECT_BGE_2 = MappingProxyType({
+    1: 6,
+    2: 2,
+    3: 0,
+    4: 0,
+    5: 0,
+})
+
+_MEM_BLTU_1 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_1,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020E0E3, # BLTU x1, x2, 0x800 => Jump to 0x00000804 (since 1 < 2)
+    0x00000010: ADDI_X1_X1_1, # it should not be executed
+    0x00000014: ADDI_X1_X1_1,
+    0x00000018: ADDI_X1_X1_1,
+    0x0000001C: ADDI_X1_X1_1,
+    0x00000020: ADDI_X1_X1_1,
+    0x00000024: ADDI_X1_X1_1,
+    0x00000028: ADDI_X1_X1_1,
+    0x0000080C: ADDI_X3_X3_3, # it should be executed
+    0x00000810: ADDI_X4_X4_4, # it should be executed
+    0x00000814: ADDI_X5_X5_5, # it should be executed
+})
+
+_EXPECT_BLTU_1 = MappingProxyType({
+    1: 1,
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+})
+
+_MEM_BLTU_2 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_5,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020E0E3, # BLTU x1, x2, 0x800 => Should not jump (since 5 >= 2)
+    0x00000010: ADDI_X1_X1_1, # it should be executed
+    0x00000014: ADDI_X1_X1_2,
+    0x00000018: ADDI_X1_X1_4,
+    0x0000080C: ADDI_X2_X2_2, # it should not be executed
+    0x00000810: ADDI_X3_X3_3, # it should not be executed
+    0x00000814: ADDI_X4_X4_4, # it should not be executed
+})
+
+_EXPECT_BLTU_2 = MappingProxyType({
+    1: 0xC,
+    2: 2,
+    3: 0,
+    4: 0,
+    5: 0,
+})
+
+_MEM_BGEU_1 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_5,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020F0E3, # BGEU x1, x2, 0x800 => Jump to 0x00000804 (since 5 >= 2)
+    0x00000010: ADDI_X1_X1_1, # it should not be executed
+    0x00000014: ADDI_X1_X1_1,
+    0x00000018: ADDI_X1_X1_1,
+    0x0000001C: ADDI_X1_X1_1,
+    0x00000020: ADDI_X1_X1_1,
+    0x00000024: ADDI_X1_X1_1,
+    0x00000028: ADDI_X1_X1_1,
+    0x0000080C: ADDI_X3_X3_3, # it should be executed
+    0x00000810: ADDI_X4_X4_4, # it should be executed
+    0x00000814: ADDI_X5_X5_5, # it should be executed
+})
+
+_EXPECT_BGEU_1 = MappingProxyType({
+    1: 5,
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+})
+
+_MEM_BGEU_2 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_1,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: 0x0020F0E3, # BGEU x1, x2, 0x800 => Should not jump (since 1 < 2)
+    0x00000010: ADDI_X1_X1_1, # it should be executed
+    0x00000014: ADDI_X1_X1_2,
+    0x00000018: ADDI_X1_X1_4,
+    0x0000080C: ADDI_X2_X2_2, # it should not be executed
+    0x00000810: ADDI_X3_X3_3, # it should not be executed
+    0x00000814: ADDI_X4_X4_4, # it should not be executed
+})
+
+_EXPECT_BGEU_2 = MappingProxyType({
+    1: 8,
+    2: 2,
+    3: 0,
+    4: 0,
+    5: 0,
+})
+
+_MEM_JAL_1 = MappingProxyType({
+    0x00000004: 0x008000EF, # JAL x1, 0x008 => Jump to 0x00000004 + 0x008 = 0x0000000C, x1 = 0x00000008
+    0x00000008: ADDI_X1_X1_1, # Should not be executed
+    0x0000000C: ADDI_X2_X2_2, # Should be executed
+    0x00000010: ADDI_X3_X3_3, # Should be executed
+    0x00000014: ADDI_X4_X4_4, # Should be executed
+})
+
+_EXPECT_JAL_1 = MappingProxyType({
+    1: 0x00000008, # return address
+    2: 2,
+    3: 3,
+    4: 4,
+})
+
+_MEM_JAL_2 = MappingProxyType({
+    0x00000004: ADDI_X1_X1_1,
+    0x00000008: ADDI_X2_X2_2,
+    0x0000000C: ADDI_X3_X3_3,
+    0x00000010: 0xFF9FF0EF, # JAL x1, -8 => Jump to 0x00000010 + (-8) = 0x00000008, x1 = 0x00000014
+    0x00000014: ADDI_X4_X4_4, # Should not be executed initially
+})
+
+_EXPECT_JAL_2 = MappingProxyType({
+    1: 0x00000014, # return address
+    2: 4, # executed twice
+    3: 6, # executed twice
+    4: 0, # not executed
+})
+
+_MEM_JAL_3 = MappingProxyType({
+    0x00000004: 0x0080006F, # JAL x0, 0x008 => Jump to 0x00000004 + 0x008 = 0x0000000C, x0 remains 0
+    0x00000008: ADDI_X1_X1_1, # Should not be executed
+    0x0000000C: ADDI_X2_X2_2, # Should be executed
+    0x00000010: ADDI_X3_X3_3, # Should be executed
+    0x00000014: ADDI_X4_X4_4, # Should be executed
+})
+
+_EXPECT_JAL_3 = MappingProxyType({
+    0: 0,
+    1: 0,
+    2: 2,
+    3: 3,
+    4: 4,
+})
+
+_MEM_JALR_1 = MappingProxyType({
+    0x00000000: 0x00000137, # LUI x2, 0x00000 => x2 = 0x00000000
+    0x00000004: 0x00111113, # # SLLI x2, x2, 1 => x2 = 0x00000000
+    0x0000000C: 0x008100E7, # JALR x1, x2, 8 => Jump to (x2 + 8) & ~1 = 0x00000008, x1 = 0x00000010
+    0x00000010: ADDI_X3_X3_3, # Should not be executed initially
+    0x00000014: ADDI_X4_X4_4, # Should not be executed
+})
+
+_EXPECT_JALR_1 = MappingProxyType({
+    1: 0x00000010, # return address
+    2: 0x00000000,
+    # The processor will keep executing from 0x00000008 onwards in a loop
+    3: 0, # not executed
+    4: 0, # not executed
+})
+
+_MEM_JALR_2 = MappingProxyType({
+    0x00000000: 0x00000137, # LUI x2, 0x00000 => x2 = 0x00000000
+    0x00000004: 0x00111113, # SLLI x2, x2, 1 => x2 = 0x00000000
+    0x00000008: 0x00110113, # ADDI x2, x2, 1 => x2 = 0x00000001 (odd address)
+    0x00000010: 0x00C100E7, # JALR x1, x2, 12 => Jump to (x2 + 12) & ~1 = (0x00000001 + 12) & ~1 = 0x0000000C
+    0x00000014: ADDI_X3_X3_3, # Should not be executed
+    0x00000018: ADDI_X4_X4_4, # Should not be executed
+    0x0000001C: ADDI_X5_X5_5, # Should not be executed
+})
+
+_EXPECT_JALR_2 = MappingProxyType({
+    1: 0x00000014, # return address
+    2: 0x00000001,
+    3: 0,
+    4: 0,
+    5: 0,
+})
+
+_MEM_JALR_3 = MappingProxyType({
+    0x00000004: 0x001000EF, # JAL x1, 0x800 => Jump to 0x00000004 + 0x800, x1 = 0x00000008
+    0x00000008: ADDI_X2_X2_2, # Should be executed after return
+    0x0000000C: ADDI_X3_X3_3, # Should be executed after return
+    0x00000804: ADDI_X4_X4_4, # Should be executed (in subroutine)
+    0x00000808: ADDI_X5_X5_5, # Should be executed (in subroutine)
+    0x0000080C: 0x000080E7, # JALR x1, x1, 0 => Return to address in x1 (0x00000008)
+    0x00000810: ADDI_X6_X6_6, # Should not be executed
+})
+
+_EXPECT_JALR_3 = MappingProxyType({
+    1: 0x00000810, # return address from JALR
+    2: 2,
+    3: 3,
+    4: 4,
+    5: 5,
+    6: 0, # not executed
+})
+
+# (name, program, cycles, expected registers)
+BRANCH_CASES = [
+    ("beq_1",  _MEM_BEQ_1,  10, _EXPECT_BEQ_1),  # BEQ: jump
+    ("beq_2",  _MEM_BEQ_2,  12, _EXPECT_BEQ_2),  # BEQ: no jump
+    ("bne_1",  _MEM_BNE_1,  12, _EXPECT_BNE_1),  # BNE: jump
+    ("bne_2",  _MEM_BNE_2,  12, _EXPECT_BNE_2),  # BNE: no jump
+    ("blt_1",  _MEM_BLT_1,  13, _EXPECT_BLT_1),  # BLT (signed): jump when rs1 < rs2
+    ("blt_2",  _MEM_BLT_2,  13, _EXPECT_BLT_2),  # BLT (signed): no jump when rs1 >= rs2
+    ("bge_1",  _MEM_BGE_1,  13, _EXPECT_BGE_1),  # BGE (signed): jump when rs1 >= rs2
+    ("bge_2",  _MEM_BGE_2,  13, _EXPECT_BGE_2),  # BGE (signed): no jump when rs1 < rs2
+    ("bltu_1", _MEM_BLTU_1, 13, _EXPECT_BLTU_1), # BLTU (unsigned): jump when rs1 < rs2
+    ("bltu_2", _MEM_BLTU_2, 13, _EXPECT_BLTU_2), # BLTU (unsigned): no jump when rs1 >= rs2
+    ("bgeu_1", _MEM_BGEU_1, 13, _EXPECT_BGEU_1), # BGEU (unsigned): jump when rs1 >= rs2
+    ("bgeu_2", _MEM_BGEU_2, 13, _EXPECT_BGEU_2), # BGEU (unsigned): no jump when rs1 < rs2
+]
 
 @cocotb.test()
-async def test_bgeu_2(dut):
-    """Test BGEU (Branch if Greater or Equal, unsigned): no jump when rs1 < rs2"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00108093, # ADDI x1, x1, 1
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x0020F0E3, # BGEU x1, x2, 0x800 => Should not jump (since 1 < 2)
-        0x00000010: 0x00108093, # ADDI x1, x1, 1 => it should be executed
-        0x00000014: 0x00208093, # ADDI x1, x1, 2
-        0x00000018: 0x00408093, # ADDI x1, x1, 4
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-        0x00000038: NOP_INSTR,
-        0x00000808: NOP_INSTR,
-        0x0000080C: 0x00210113, # ADDI x2, x2, 2 => it should not be executed
-        0x00000810: 0x00318193, # ADDI x3, x3, 3 => it should not be executed
-        0x00000814: 0x00420213, # ADDI x4, x4, 4 => it should not be executed
-        0x00000818: NOP_INSTR,
-        0x0000081C: NOP_INSTR,
-        0x00000820: NOP_INSTR,
-        0x00000824: NOP_INSTR,
-        0x00000828: NOP_INSTR,
-        0x0000082C: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 8, f"Register x1 should be 8, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 0, f"Register x5 should be 0, got 0x{registers[5].value.integer:08x}"
+@cocotb.parametrize((("name", "program", "cycles", "expected"), BRANCH_CASES))
+async def test_branch(dut, name, program, cycles, expected):
+    """Test conditional branches (BEQ, BNE, BLT, BGE, BLTU, BGEU): taken and not taken"""
 
-@cocotb.test()
-async def test_jal_1(dut):
-    """Test JAL (Jump and Link): basic jump with return address"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x008000EF, # JAL x1, 0x008 => Jump to 0x00000004 + 0x008 = 0x0000000C, x1 = 0x00000008
-        0x00000008: 0x00108093, # ADDI x1, x1, 1 => Should not be executed
-        0x0000000C: 0x00210113, # ADDI x2, x2, 2 => Should be executed
-        0x00000010: 0x00318193, # ADDI x3, x3, 3 => Should be executed
-        0x00000014: 0x00420213, # ADDI x4, x4, 4 => Should be executed
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-    }
-    await do_test(dut, memory, 12)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0x00000008, f"Register x1 should be 0x00000008 (return address), got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+    await do_test(dut, program, cycles)
 
-@cocotb.test()
-async def test_jal_2(dut):
-    """Test JAL (Jump and Link): negative offset jump"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x00108093, # ADDI x1, x1, 1
-        0x00000008: 0x00210113, # ADDI x2, x2, 2
-        0x0000000C: 0x00318193, # ADDI x3, x3, 3
-        0x00000010: 0xFF9FF0EF, # JAL x1, -8 => Jump to 0x00000010 + (-8) = 0x00000008, x1 = 0x00000014
-        0x00000014: 0x00420213, # ADDI x4, x4, 4 => Should not be executed initially
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-    }
-    await do_test(dut, memory, 9)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0x00000014, f"Register x1 should be 0x00000014 (return address), got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 4, f"Register x2 should be 4 (executed twice), got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 6, f"Register x3 should be 6 (executed twice), got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0 (not executed), got 0x{registers[4].value.integer:08x}"
+    check_registers(dut, expected)
 
-@cocotb.test()
-async def test_jal_3(dut):
-    """Test JAL (Jump and Link): jump to x0 (discard return address)"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x0080006F, # JAL x0, 0x008 => Jump to 0x00000004 + 0x008 = 0x0000000C, x0 remains 0
-        0x00000008: 0x00108093, # ADDI x1, x1, 1 => Should not be executed
-        0x0000000C: 0x00210113, # ADDI x2, x2, 2 => Should be executed
-        0x00000010: 0x00318193, # ADDI x3, x3, 3 => Should be executed
-        0x00000014: 0x00420213, # ADDI x4, x4, 4 => Should be executed
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000030: NOP_INSTR,
-        0x00000034: NOP_INSTR,
-    }
-    await do_test(dut, memory, 12)
-
-    registers = dut.core.register_file.registers
-    assert registers[0].value == 0, f"Register x0 should always be 0, got 0x{registers[0].value.integer:08x}"
-    assert registers[1].value == 0, f"Register x1 should be 0, got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
+# (name, program, cycles, expected registers)
+JUMP_CASES = [
+    ("jal_1",  _MEM_JAL_1,  12, _EXPECT_JAL_1),  # JAL: basic jump with return address
+    ("jal_2",  _MEM_JAL_2,   9, _EXPECT_JAL_2),  # JAL: negative offset jump
+    ("jal_3",  _MEM_JAL_3,  12, _EXPECT_JAL_3),  # JAL: jump to x0 (discard return address)
+    ("jalr_1", _MEM_JALR_1, 16, _EXPECT_JALR_1), # JALR: with offset
+    ("jalr_2", _MEM_JALR_2, 16, _EXPECT_JALR_2), # JALR: LSB clearing (address alignment)
+    ("jalr_3", _MEM_JALR_3, 13, _EXPECT_JALR_3), # JALR: return from subroutine simulation
+]
 
 @cocotb.test()
-async def test_jalr_1(dut):
-    """Test JALR (Jump and Link Register): with offset"""
-
-    memory = {
-        0x00000000: 0x00000137, # LUI x2, 0x00000 => x2 = 0x00000000
-        0x00000004: 0x00111113, # # SLLI x2, x2, 1 => x2 = 0x00000000
-        0x00000008: NOP_INSTR,
-        0x0000000C: 0x008100E7, # JALR x1, x2, 8 => Jump to (x2 + 8) & ~1 = 0x00000008, x1 = 0x00000010
-        0x00000010: 0x00318193, # ADDI x3, x3, 3 => Should not be executed initially
-        0x00000014: 0x00420213, # ADDI x4, x4, 4 => Should not be executed
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-    }
-    await do_test(dut, memory, 16)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0x00000010, f"Register x1 should be 0x00000010 (return address), got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 0x00000000, f"Register x2 should be 0x00000000, got 0x{registers[2].value.integer:08x}"
-    # The processor will keep executing from 0x00000008 onwards in a loop
-    assert registers[3].value == 0, f"Register x3 should be 0 (not executed), got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0 (not executed), got 0x{registers[4].value.integer:08x}"
+@cocotb.parametrize((("name", "program", "cycles", "expected"), JUMP_CASES))
+async def test_jump(dut, name, program, cycles, expected):
+    """Test unconditional jumps (JAL, JALR) and their return addresses"""
 
-@cocotb.test()
-async def test_jalr_2(dut):
-    """Test JALR (Jump and Link Register): LSB clearing (address alignment)"""
-
-    memory = {
-        0x00000000: 0x00000137, # LUI x2, 0x00000 => x2 = 0x00000000
-        0x00000004: 0x00111113, # SLLI x2, x2, 1 => x2 = 0x00000000
-        0x00000008: 0x00110113, # ADDI x2, x2, 1 => x2 = 0x00000001 (odd address)
-        0x0000000C: NOP_INSTR,
-        0x00000010: 0x00C100E7, # JALR x1, x2, 12 => Jump to (x2 + 12) & ~1 = (0x00000001 + 12) & ~1 = 0x0000000C
-        0x00000014: 0x00318193, # ADDI x3, x3, 3 => Should not be executed
-        0x00000018: 0x00420213, # ADDI x4, x4, 4 => Should not be executed
-        0x0000001C: 0x00528293, # ADDI x5, x5, 5 => Should not be executed
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-    }
-    await do_test(dut, memory, 16)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0x00000014, f"Register x1 should be 0x00000014 (return address), got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 0x00000001, f"Register x2 should be 0x00000001, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 0, f"Register x3 should be 0, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 0, f"Register x4 should be 0, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 0, f"Register x5 should be 0, got 0x{registers[5].value.integer:08x}"
+    await do_test(dut, program, cycles)
 
-@cocotb.test()
-async def test_jalr_3(dut):
-    """Test JALR (Jump and Link Register): return from subroutine simulation"""
-
-    memory = {
-        0x00000000: NOP_INSTR,
-        0x00000004: 0x001000EF, # JAL x1, 0x800 => Jump to 0x00000004 + 0x800, x1 = 0x00000008
-        0x00000008: 0x00210113, # ADDI x2, x2, 2 => Should be executed after return
-        0x0000000C: 0x00318193, # ADDI x3, x3, 3 => Should be executed after return
-        0x00000010: NOP_INSTR,
-        0x00000014: NOP_INSTR,
-        0x00000018: NOP_INSTR,
-        0x0000001C: NOP_INSTR,
-        0x00000020: NOP_INSTR,
-        0x00000024: NOP_INSTR,
-        0x00000028: NOP_INSTR,
-        0x0000002C: NOP_INSTR,
-        0x00000804: 0x00420213, # ADDI x4, x4, 4 => Should be executed (in subroutine)
-        0x00000808: 0x00528293, # ADDI x5, x5, 5 => Should be executed (in subroutine)
-        0x0000080C: 0x000080E7, # JALR x1, x1, 0 => Return to address in x1 (0x00000008)
-        0x00000810: 0x00630313, # ADDI x6, x6, 6 => Should not be executed
-        0x00000814: NOP_INSTR,
-        0x00000018: NOP_INSTR,
-    }
-    await do_test(dut, memory, 13)
-
-    registers = dut.core.register_file.registers
-    assert registers[1].value == 0x00000810, f"Register x1 should be 0x0000810 (return address from JALR), got 0x{registers[1].value.integer:08x}"
-    assert registers[2].value == 2, f"Register x2 should be 2, got 0x{registers[2].value.integer:08x}"
-    assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
-    assert registers[4].value == 4, f"Register x4 should be 4, got 0x{registers[4].value.integer:08x}"
-    assert registers[5].value == 5, f"Register x5 should be 5, got 0x{registers[5].value.integer:08x}"
-    assert registers[6].value == 0, f"Register x6 should be 0 (not executed), got 0x{registers[6].value.integer:08x}"
+    check_registers(dut, expected)
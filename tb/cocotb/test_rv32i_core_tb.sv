@@ -4,6 +4,12 @@ module test_rv32i_core_tb;
     // Clock and reset
     reg clk;
     reg rst_n;
+
+`ifdef TB_CLOCK
+    // 10ns clock generated in HDL; test_utils.start_clock() then leaves clk alone
+    initial clk = 1'b1;
+    always #5 clk = ~clk;
+`endif
     
     // Memory interface
     wire [31:0] instr_data;
@@ -33,6 +39,16 @@ module test_rv32i_core_tb;
         .o_mem_re(mem_re)
     );
 
+    // All 32 core registers in one vector (x0 in bits 31:0), so the tests can
+    // read the whole register file through a single handle
+    wire [32*32-1:0] regs_flat;
+    genvar reg_idx;
+    generate
+        for (reg_idx = 0; reg_idx < 32; reg_idx = reg_idx + 1) begin : g_regs_flat
+            assign regs_flat[reg_idx*32 +: 32] = core.register_file.registers[reg_idx];
+        end
+    endgenerate
+
     // Monitor signals
     // always @(posedge clk) begin
     //     string instr_str;
@@ -41,10 +57,12 @@ module test_rv32i_core_tb;
     //              $time, instr_addr, instr_data, instr_str, mem_addr, mem_data, mem_wdata, mem_we, mem_re);
     // end
 
+`ifndef NO_WAVES
     // Waveform dump for cocotb
     initial begin
         $dumpfile("vcd/test_rv32i_core_tb.vcd");
         $dumpvars(0, test_rv32i_core_tb);
     end
+`endif
 
 endmodule 
\ No newline at end of file
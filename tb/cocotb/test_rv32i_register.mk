@@ -7,7 +7,23 @@ TOPLEVEL_LANG ?= verilog
 VERILOG_SOURCES += $(PWD)/rtl/rv32i_register.v
 VERILOG_SOURCES += $(PWD)/tb/cocotb/test_rv32i_register_tb.v
 
-COMPILE_ARGS += -g2012 -I$(PWD)/rtl -DSIMULATION
+COMPILE_ARGS += -I$(PWD)/rtl -DSIMULATION
+
+ifeq ($(SIM),icarus)
+COMPILE_ARGS += -g2012
+endif
+
+# The testbench generates its own clock with a delay, which Verilator only
+# accepts with --timing; --public-flat-rw keeps dut.registers visible to
+# test_register_reset
+ifeq ($(SIM),verilator)
+EXTRA_ARGS += -O3 --x-assign fast --x-initial fast --public-flat-rw --timing
+endif
+
+# PROFILE=1 profiles the Python side of the run into test_profile.pstat
+ifeq ($(PROFILE),1)
+export COCOTB_ENABLE_PROFILING = 1
+endif
 
 # TOPLEVEL is the name of the toplevel module in your Verilog or VHDL file
 TOPLEVEL = test_rv32i_register_tb
@@ -12,6 +12,10 @@ module test_rv32i_register_tb;
     reg [31:0] rd_data;
     reg rd_we;
 
+    // 10ns clock generated in HDL, so the tests only wait on its edges
+    initial clk = 1'b1;
+    always #5 clk = ~clk;
+
     // Instantiate the register file
     rv32i_register dut (
         .clk(clk),
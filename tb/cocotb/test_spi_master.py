@@ -90,7 +90,7 @@ async def test_spi_read_write_config(dut):
                 return True
             return False
         
-        await test_spi_memory(dut, memory, max_cycles, callback)
+        await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
 
 
 @cocotb.test()
@@ -128,7 +128,7 @@ async def test_spi_status_read_only(dut):
             return True
         return False
     
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
 
 
 @cocotb.test()
@@ -166,7 +166,7 @@ async def test_spi_ctrl_write_only(dut):
             return True
         return False
     
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
 
 
 @cocotb.test()
@@ -218,7 +218,7 @@ async def test_spi_tx_data_write_only(dut):
             return True
         return False
     
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
 
 
 @cocotb.test()
@@ -256,7 +256,7 @@ async def test_spi_rx_data_read_only(dut):
             return True
         return False
     
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
 
 
 @cocotb.test()
@@ -321,7 +321,7 @@ async def test_spi_reset_values(dut):
             return True
         return False
     
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
 
 
 @cocotb.test()
@@ -395,7 +395,7 @@ async def test_spi_tx(dut):
             return True
         return False
 
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.o_instr_addr)
     bfm.stop()
 
 
@@ -460,7 +460,7 @@ async def test_spi_transfer(dut, test_id, length, cpol=0, cpha=0):
             return True
         return False
 
-    await test_spi_memory(dut, memory, max_cycles, callback)
+    await test_spi_memory(dut, memory, max_cycles, callback, watch=dut.soc_inst.cpu_core.if_instr)
     bfm.stop()
 
 
@@ -37,7 +37,7 @@ async def test_spi_instr(dut):
     def callback(dut, memory):
         if dut.soc_inst.cpu_core.o_instr_addr.value == 0x00000030:
             registers = dut.soc_inst.cpu_core.register_file.registers
-            assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.integer:08x}"
+            assert registers[3].value == 3, f"Register x3 should be 3, got 0x{registers[3].value.to_unsigned():08x}"
             return True
         return False
 
@@ -72,7 +72,7 @@ async def test_spi_data(dut):
     def callback(dut, memory):
         if dut.soc_inst.cpu_core.o_instr_addr.value == 0x00000030:
             registers = dut.soc_inst.cpu_core.register_file.registers
-            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.integer:08x}"
+            assert registers[3].value == 0x123, f"Register x3 should be 0x123, got 0x{registers[3].value.to_unsigned():08x}"
             return True
         return False
 
@@ -112,7 +112,7 @@ async def test_sh(dut):
             mem_value = read_word_from_memory(memory, 0x01000320)
             assert mem_value == 0x56347777, f"Memory[0x01000320] should be 0x56347777, got 0x{mem_value:08x}"
             registers = dut.soc_inst.cpu_core.register_file.registers
-            assert registers[3].value == 0x3456, f"Register x3 should be 0x3456, got 0x{registers[3].value.integer:08x}"
+            assert registers[3].value == 0x3456, f"Register x3 should be 0x3456, got 0x{registers[3].value.to_unsigned():08x}"
             return True
         return False
 
@@ -153,7 +153,7 @@ async def test_spi_bin_file(dut):
             if cycles == 0:
                 print("Test finished, checking results")
                 registers = dut.soc_inst.cpu_core.register_file.registers
-                assert registers[10].value == 0, f"Register x10 should be 0, got 0x{registers[10].value.integer:08x}"
+                assert registers[10].value == 0, f"Register x10 should be 0, got 0x{registers[10].value.to_unsigned():08x}"
                 return True
         return False
 
@@ -58,8 +58,8 @@ async def test_uart_rx(dut):
             if cycles == 0:
                 print("Test finished, checking results")
                 registers = dut.soc_inst.cpu_core.register_file.registers
-                assert registers[10].value == 0, f"Register x10 should be 0, got 0x{registers[10].value.integer:08x}"
-                assert registers[7].value == 0x43, f"Register x7 should be 0x43, got 0x{registers[7].value.integer:08x}"
+                assert registers[10].value == 0, f"Register x10 should be 0, got 0x{registers[10].value.to_unsigned():08x}"
+                assert registers[7].value == 0x43, f"Register x7 should be 0x43, got 0x{registers[7].value.to_unsigned():08x}"
                 return True;
         return False
 
@@ -1,5 +1,9 @@
+import functools
+import os
+from array import array
+
 import cocotb
-from cocotb.triggers import RisingEdge, FallingEdge, Timer
+from cocotb.triggers import RisingEdge, FallingEdge, ClockCycles
 from cocotb.clock import Clock
 
 # Constants
@@ -127,6 +131,11 @@ def encode_addi(rd, rs1, imm12):
     return (imm12 << 20) | (rs1 << 15) | (0x0 << 12) | (rd << 7) | 0x13
 
 
+def encode_add(rd, rs1, rs2):
+    """Encode ADD instruction: rd = rs1 + rs2"""
+    return (0x00 << 25) | (rs2 << 20) | (rs1 << 15) | (0x0 << 12) | (rd << 7) | 0x33
+
+
 def encode_andi(rd, rs1, imm12):
     """Encode ANDI instruction: rd = rs1 & imm12"""
     return (imm12 << 20) | (rs1 << 15) | (0x7 << 12) | (rd << 7) | 0x13
@@ -219,14 +228,25 @@ def encode_csrrci(rd, csr, imm):
     """Encode CSRRCI instruction: rd = CSR[csr]; CSR[csr] &= ~imm"""
     return (csr << 20) | (imm << 15) | (0x7 << 12) | (rd << 7) | 0x73
 
-# Global variables to track memory operations
-mem_addr = 0x00000000
-mem_wdata = 0x00000000
-mem_flag = 0x00000000
+class MemCapture:
+    """Address, data and flag of the last memory write completed by do_test"""
+    __slots__ = ("addr", "wdata", "flag")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Forget the last write, so a run that stores nothing reads back None"""
+        self.addr = None
+        self.wdata = None
+        self.flag = None
+
+# Last memory write seen by do_test
+mem_capture = MemCapture()
 
 def get_mem_vars():
     """Get the current memory variables (for testing)"""
-    return mem_addr, mem_wdata, mem_flag
+    return mem_capture.addr, mem_capture.wdata, mem_capture.flag
 
 def convert_word_memory_to_byte_memory(word_memory):
     """Convert word-aligned memory dictionary to byte-addressed memory dictionary
@@ -271,26 +291,198 @@ def read_word_from_byte_memory(byte_memory, addr):
     # Combine in little-endian format
     return (byte3 << 24) | (byte2 << 16) | (byte1 << 8) | byte0
 
+def build_memory_image(word_memory, fill=NOP_INSTR):
+    """Lay out a word-aligned memory dictionary as one contiguous image
+
+    Args:
+        word_memory: Dictionary with word-aligned addresses (keys are multiples of 4) as keys
+                    and 32-bit values
+        fill: Word stored at addresses that are not in word_memory (default: NOP)
+
+    Returns:
+        bytearray covering address 0 up to one fill word past the last word,
+        little-endian, so a halfword fetch at the last word reads a whole word
+    """
+    words = (max(word_memory, default=-4) + 8) // 4
+    image = bytearray(fill.to_bytes(4, "little") * words)
+    for word_addr, word_value in word_memory.items():
+        if word_addr % 4 != 0:
+            raise ValueError(f"Memory address 0x{word_addr:08x} is not word-aligned")
+        image[word_addr:word_addr + 4] = word_value.to_bytes(4, "little")
+    return image
+
+def read_word_from_image(image, addr):
+    """Read a 32-bit little-endian word from a memory image
+
+    Args:
+        image: bytearray returned by build_memory_image()
+        addr: Byte address (can be any byte address, not necessarily word-aligned)
+
+    Returns:
+        32-bit word value; memory past the end of the image reads as NOP_INSTR,
+        as it does for instruction fetches in do_test()
+    """
+    if addr >= len(image):
+        return NOP_INSTR
+    padded = bytes(image[addr:addr + 4]) + NOP_INSTR.to_bytes(4, "little")
+    return int.from_bytes(padded[:4], "little")
+
+# Register-file handles resolved by get_registers(), keyed by DUT path
+_register_handles = {}
+
+def get_registers(dut):
+    """Return the handles of the core's 32 registers
+
+    The hierarchy walk to dut.core.register_file.registers[i] is done once
+    per DUT; every later call returns the same list of handles.
+    """
+    handles = _register_handles.get(dut._path)
+    if handles is None:
+        registers = dut.core.register_file.registers
+        handles = [registers[i] for i in range(32)]
+        _register_handles[dut._path] = handles
+    return handles
+
+def _register_slices(dut, indices):
+    """Cut the requested registers out of the testbench's regs_flat vector
+
+    Returns the raw 32-bit LogicArray slices, so X/Z bits in one register
+    do not affect reading the others.
+    """
+    flat = dut.regs_flat.value
+    return {i: flat[32 * i + 31:32 * i] for i in indices}
+
+def read_registers(dut, indices=range(32)):
+    """Read the core's register file with one access to the testbench's regs_flat
+
+    Args:
+        dut: test_rv32i_core_tb handle
+        indices: Register numbers to read (default: all 32)
+
+    Returns:
+        Dictionary mapping register number to its unsigned value
+    """
+    slices = _register_slices(dut, indices)
+    unresolved = [f"x{i} is {value}" for i, value in slices.items() if not value.is_resolvable]
+    assert not unresolved, "Register holds X/Z: " + "; ".join(unresolved)
+    return {i: value.to_unsigned() for i, value in slices.items()}
+
+def build_fetch_table(image):
+    """Pre-decode the instruction word at every halfword address of a memory image
+
+    Args:
+        image: bytearray returned by build_memory_image()
+
+    Returns:
+        array('I') where entry addr >> 1 holds the 32-bit word at addr;
+        halfword granularity covers RV32C fetches, and the image is extended
+        by one NOP word so the entry at the last halfword is a full word
+    """
+    padded = bytes(image) + NOP_INSTR.to_bytes(4, "little")
+    return array("I", (int.from_bytes(padded[addr:addr + 4], "little") for addr in range(0, len(image), 2)))
+
+@functools.lru_cache(maxsize=None)
+def _load_program(items):
+    image = bytes(build_memory_image(dict(items)))
+    return image, build_fetch_table(image)
+
+def load_program(memory):
+    """Build (or reuse) the memory image and fetch table for a program
+
+    Programs are static test vectors, so the image and fetch table are built
+    once per distinct program and shared by every do_test call that runs it.
+
+    Args:
+        memory: Dictionary with word-aligned addresses as keys and 32-bit values
+
+    Returns:
+        (image, fetch_table) as returned by build_memory_image() and
+        build_fetch_table(); the image is returned as read-only bytes and
+        the shared fetch table must not be modified
+    """
+    return _load_program(tuple(sorted(memory.items())))
+
+def check_registers(dut, expected):
+    """Check several core registers against expected values in one comparison
+
+    Every register is compared before failing, and the assertion message lists
+    all mismatching registers, not just the first one.
+
+    Args:
+        dut: test_rv32i_core_tb handle
+        expected: Dictionary mapping register number to expected 32-bit value
+    """
+    got = _register_slices(dut, expected)
+    mismatches = []
+    for i, want in expected.items():
+        value = got[i]
+        if not value.is_resolvable:
+            mismatches.append(f"x{i} should be 0x{want:08x}, got {value}")
+        elif value.to_unsigned() != want:
+            mismatches.append(f"x{i} should be 0x{want:08x}, got 0x{value.to_unsigned():08x}")
+    assert not mismatches, "Register mismatch: " + "; ".join(mismatches)
+
+# Clock tasks started by start_clock(), keyed by clock signal path
+_clock_tasks = {}
+
+def start_clock(dut):
+    """Start the 10ns core clock on dut.clk unless it is already running
+
+    cocotb cancels every task at the end of a test, so the clock is started
+    once per test no matter how many helpers (or do_test calls) ask for it.
+    When TB_CLOCK=1 the testbench was built with its own HDL clock and
+    nothing is started.
+    """
+    if os.environ.get("TB_CLOCK") == "1":
+        return
+    task = _clock_tasks.get(dut.clk._path)
+    if task is None or task.done():
+        clock = Clock(dut.clk, 10, unit="ns")
+        _clock_tasks[dut.clk._path] = cocotb.start_soon(clock.start())
+
+async def reset_dut(dut, cycles=2):
+    """Hold rst_n low for the given number of clock periods, then release it
+
+    Reset is released right after the rising edge that ends the last period,
+    the 20 ns point of the original fixed-delay reset that the cycle counts
+    in the core tests were calibrated against.
+    """
+    dut.rst_n.value = 0
+    await ClockCycles(dut.clk, cycles, rising=False)
+    await RisingEdge(dut.clk)
+    dut.rst_n.value = 1
+
+async def setup_dut(dut):
+    """Start the clock and reset the DUT"""
+    start_clock(dut)
+    await reset_dut(dut)
+
 async def do_test(dut, memory, cycles, mem_data=0x00000000):
-    """Do test"""
-    global mem_addr, mem_wdata, mem_flag
+    """Do test
+
+    Words that the program in memory does not list are fetched as NOP_INSTR,
+    so programs only need to give the instructions under test.
+    """
+
+    # Lay out the word-aligned memory as one contiguous image and pre-decode
+    # the word fetched at each halfword address
+    image, fetch_table = load_program(memory)
 
-    # Convert word-aligned memory to byte-addressed memory internally
-    byte_memory = convert_word_memory_to_byte_memory(memory)
+    # Drop the previous test's write so its values cannot pass this test
+    mem_capture.clear()
 
-    clock = Clock(dut.clk, 10, unit="ns")
-    cocotb.start_soon(clock.start())
+    start_clock(dut)
     
-    # Read initial instruction from byte memory
-    dut.instr_data.value = read_word_from_byte_memory(byte_memory, 0x00000000)
+    # Read initial instruction from the memory image
+    instr_data = fetch_table[0]
+    instr_ready = 0
+    mem_ready = 0
+    dut.instr_data.value = instr_data
     dut.mem_data.value = mem_data
-    dut.instr_ready.value = 0
-    dut.mem_ready.value = 0
+    dut.instr_ready.value = instr_ready
+    dut.mem_ready.value = mem_ready
 
-    # Reset
-    dut.rst_n.value = 0
-    await Timer(20, unit="ns")
-    dut.rst_n.value = 1
+    await reset_dut(dut)
 
     current_pc = 0xFFFFFFFF
     current_mem_we = 0
@@ -302,7 +494,9 @@ async def do_test(dut, memory, cycles, mem_data=0x00000000):
     for _ in range(cycles * MEMORY_CYCLES):
         await FallingEdge(dut.clk)
         if mem_wait_cycles == 0 and ((dut.mem_we.value == 1 and current_mem_we == 0) or (dut.mem_re.value == 1 and current_mem_re == 0)):
-            dut.mem_ready.value = 0
+            if mem_ready:
+                mem_ready = 0
+                dut.mem_ready.value = 0
             mem_wait_cycles = MEMORY_CYCLES
             current_mem_we = dut.mem_we.value
             current_mem_re = dut.mem_re.value
@@ -310,17 +504,20 @@ async def do_test(dut, memory, cycles, mem_data=0x00000000):
         if mem_wait_cycles > 0:
             mem_wait_cycles -= 1
             if mem_wait_cycles == 0:
+                mem_ready = 1
                 dut.mem_ready.value = 1
                 if (current_mem_we == 1):
-                    mem_addr = dut.mem_addr.value.to_unsigned()
-                    mem_wdata = dut.mem_wdata.value.to_unsigned()
-                    mem_flag = dut.mem_flag.value.to_unsigned()
+                    mem_capture.addr = dut.mem_addr.value.to_unsigned()
+                    mem_capture.wdata = dut.mem_wdata.value.to_unsigned()
+                    mem_capture.flag = dut.mem_flag.value.to_unsigned()
                 # Reset current memory operation flags when memory operation completes
                 current_mem_we = 0
                 current_mem_re = 0
 
         if instr_wait_cycles == 0 and dut.instr_addr.value.to_unsigned() != current_pc:
-            dut.instr_ready.value = 0
+            if instr_ready:
+                instr_ready = 0
+                dut.instr_ready.value = 0
             instr_wait_cycles = MEMORY_CYCLES
             current_pc = dut.instr_addr.value.to_unsigned()
 
@@ -328,11 +525,23 @@ async def do_test(dut, memory, cycles, mem_data=0x00000000):
         if mem_wait_cycles == 0 and instr_wait_cycles > 0:
             instr_wait_cycles -= 1
             if instr_wait_cycles == 0:
-                # Read instruction from byte-addressed memory
+                # Read instruction from the memory image
+                # Only drive instr_data when the word changes (e.g. runs of NOPs)
                 instr_addr = dut.instr_addr.value.to_unsigned()
-                dut.instr_data.value = read_word_from_byte_memory(byte_memory, instr_addr)
+                index = instr_addr >> 1
+                if index < len(fetch_table) and not instr_addr & 1:
+                    word = fetch_table[index]
+                elif instr_addr < len(image):
+                    word = read_word_from_image(image, instr_addr)
+                else:
+                    # Memory past the end of the program reads as NOPs
+                    word = NOP_INSTR
+                if word != instr_data:
+                    instr_data = word
+                    dut.instr_data.value = word
+                instr_ready = 1
                 dut.instr_ready.value = 1
 
         # print(f"mem_wait_cycles={mem_wait_cycles}, instr_wait_cycles={instr_wait_cycles}")
-        # print(f"Cycle {_}: PC={dut.instr_addr.value.to_unsigned():08x}, Instr={read_word_from_byte_memory(byte_memory, dut.instr_addr.value.to_unsigned()):08x}")
-        # print(f"Cycle {_}: mem_addr={dut.mem_addr.value.integer:08x}, mem_data={dut.mem_data.value.integer:08x}, mem_wdata={dut.mem_wdata.value.integer:08x}, mem_flag={dut.mem_flag.value.integer:08x}")
\ No newline at end of file
+        # print(f"Cycle {_}: PC={dut.instr_addr.value.to_unsigned():08x}, Instr={read_word_from_image(image, dut.instr_addr.value.to_unsigned()):08x}")
+        # print(f"Cycle {_}: mem_addr={dut.mem_addr.value.to_unsigned():08x}, mem_data={dut.mem_data.value.to_unsigned():08x}, mem_wdata={dut.mem_wdata.value.to_unsigned():08x}, mem_flag={dut.mem_flag.value.to_unsigned():08x}")
\ No newline at end of file